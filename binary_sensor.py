@@ -1,12 +1,20 @@
 import logging
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
+from homeassistant.core import callback
 from homeassistant.helpers.event import async_track_state_change_event
 
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Sensors whose 'unsafe' state makes the binary sensor unsafe
+_SOURCES = (
+    "sensor.amber_alert",
+    "sensor.burgernet_search",
+    "sensor.nl_alert",
+)
+
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up the NL Active Alert binary sensor."""
@@ -21,36 +29,27 @@ class NLActiveAlertBinarySensor(BinarySensorEntity):
         self._attr_name = "NL Active Alert"
         self._attr_unique_id = "nl_active_alert"
         self._attr_device_class = "safety"
-
-        # Listen for state changes on each sensor
-        self._unsub = async_track_state_change_event(
-            hass,
-            [
-                "sensor.amber_alert",
-                "sensor.burgernet_search",
-                "sensor.nl_alert",
-            ],
-            self._state_listener,
-        )
-
-    def _state_listener(self, event):
-        """Trigger an update when any sensor changes."""
-        self.async_write_ha_state()
-
-    @property
-    def is_on(self) -> bool:
-        """Return True (unsafe) if any sensor reports 'unsafe'."""
-        for entity in [
-            "sensor.amber_alert",
-            "sensor.burgernet_search",
-            "sensor.nl_alert",
-        ]:
-            state = self.hass.states.get(entity)
-            if state and state.state == "unsafe":
-                return True
-        return False
-
-    async def async_will_remove_from_hass(self):
-        """Clean up listener on unload."""
-        if self._unsub:
-            self._unsub()
+        self._attr_is_on = False
+        # Last known state per source sensor, updated from change events
+        self._states = {}
+
+    async def async_added_to_hass(self):
+        """Seed the source states and listen for changes on each sensor."""
+        await super().async_added_to_hass()
+        for entity_id in _SOURCES:
+            state = self.hass.states.get(entity_id)
+            self._states[entity_id] = state.state if state else None
+        self._attr_is_on = "unsafe" in self._states.values()
+        self.async_on_remove(
+            async_track_state_change_event(self.hass, _SOURCES, self._state_listener)
+        )
+
+    @callback
+    def _state_listener(self, event):
+        """Update the changed source and write state only when the result changes."""
+        new_state = event.data.get("new_state")
+        self._states[event.data["entity_id"]] = new_state.state if new_state else None
+        is_on = "unsafe" in self._states.values()
+        if is_on != self._attr_is_on:
+            self._attr_is_on = is_on
+            self.async_write_ha_state()
@@ -1,15 +1,25 @@
 import asyncio
+import hashlib
 import math
 import logging
-from datetime import timedelta
+import time
+from datetime import datetime, timedelta
 
-import async_timeout
+import aiohttp
+import numpy as np
 
 from homeassistant.components.sensor import SensorEntity
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, CoordinatorEntity
-from homeassistant.const import CONF_ENTITY_ID
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+from homeassistant.const import CONF_ENTITY_ID, EVENT_CORE_CONFIG_UPDATE
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .const import (
     DOMAIN,
@@ -21,17 +31,49 @@ from .const import (
 )
 
 _LOGGER = logging.getLogger(__name__)
-SCAN_INTERVAL = timedelta(minutes=10)
-
 
-def haversine(lat1, lon1, lat2, lon2):
-    """Calculate distance (m) between two lat/lon points."""
+# Poll interval per feed right after its content changed; while a feed stays
+# unchanged its interval doubles up to the max (4, 8, 16, 30 min). NL-Alert
+# is the urgent feed and never backs off. Feeds are only fetched on a
+# coordinator tick, so every interval is a whole multiple of SCAN_INTERVAL.
+AMBER_INTERVAL = timedelta(minutes=4)
+AMBER_MAX_INTERVAL = timedelta(minutes=30)
+NL_ALERT_INTERVAL = timedelta(minutes=2)
+NL_ALERT_MAX_INTERVAL = NL_ALERT_INTERVAL
+BURGERNET_INTERVAL = timedelta(minutes=4)
+BURGERNET_MAX_INTERVAL = timedelta(minutes=30)
+# The coordinator ticks at the shortest feed interval
+SCAN_INTERVAL = NL_ALERT_INTERVAL
+# Tolerance for coordinator tick jitter when deciding whether a feed is due
+FEED_DUE_SLACK = 5
+# Per-request budget, covering connect and reading the body
+FETCH_TIMEOUT = aiohttp.ClientTimeout(total=15)
+
+# Coordinator data key -> feed endpoint
+FEED_AMBER = "amber"
+FEED_NL_ALERT = "nl"
+FEED_BURGERNET = "burgernet"
+FEEDS = {
+    FEED_AMBER: BURGERNET_API,
+    FEED_NL_ALERT: NL_ALERT_API,
+    FEED_BURGERNET: BURGERNET_ACTIONS_API,
+}
+FEED_INTERVALS = {
+    FEED_AMBER: (AMBER_INTERVAL, AMBER_MAX_INTERVAL),
+    FEED_NL_ALERT: (NL_ALERT_INTERVAL, NL_ALERT_MAX_INTERVAL),
+    FEED_BURGERNET: (BURGERNET_INTERVAL, BURGERNET_MAX_INTERVAL),
+}
+
+
+def _haversine_np(lat0, lon0, lats, lons):
+    """Calculate distances (m) from one lat/lon point to arrays of points."""
     R = 6371000
-    f1, f2 = math.radians(lat1), math.radians(lat2)
-    dlat = math.radians(lat2 - lat1)
-    dlon = math.radians(lon2 - lon1)
-    a = math.sin(dlat / 2) ** 2 + math.cos(f1) * math.cos(f2) * math.sin(dlon / 2) ** 2
-    return R * (2 * math.atan2(math.sqrt(a), math.sqrt(1 - a)))
+    f1 = math.radians(lat0)
+    f2 = np.radians(lats)
+    dlat = f2 - f1
+    dlon = np.radians(lons - lon0)
+    a = np.sin(dlat / 2) ** 2 + math.cos(f1) * np.cos(f2) * np.sin(dlon / 2) ** 2
+    return 2 * R * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
 
 
 def _resolve_coordinates(hass, location_source, tracker_entity_id):
@@ -59,72 +101,98 @@ async def async_setup_entry(hass, entry, async_add_entities):
     max_actions = max(1, min(3, max_actions))
     session = async_get_clientsession(hass)
 
-    # AmberAlert JSON coordinator (Burgernet landactiehost API)
-    async def _fetch_amber():
-        async with async_timeout.timeout(15):
-            resp = await session.get(
-                BURGERNET_API,
-                headers={"Accept": "application/json"},
-            )
+    # Per-feed validators, last payload for conditional GETs and poll schedule
+    feed_cache = {
+        feed: {
+            "etag": None,
+            "last_modified": None,
+            "digest": None,
+            "data": None,
+            "interval": FEED_INTERVALS[feed][0].total_seconds(),
+            "next_fetch": 0.0,
+            "failed": False,
+        }
+        for feed in FEEDS
+    }
+
+    async def _fetch_json(feed, url):
+        cache = feed_cache[feed]
+        now = time.monotonic()
+        if now < cache["next_fetch"]:
+            return None if cache["failed"] else cache["data"]
+
+        headers = {"Accept": "application/json"}
+        if cache["etag"]:
+            headers["If-None-Match"] = cache["etag"]
+        if cache["last_modified"]:
+            headers["If-Modified-Since"] = cache["last_modified"]
+
+        min_interval, max_interval = FEED_INTERVALS[feed]
+        # A failing feed is retried after its minimum interval, not every tick
+        cache["next_fetch"] = now + min_interval.total_seconds() - FEED_DUE_SLACK
+
+        resp = await session.get(url, headers=headers, timeout=FETCH_TIMEOUT)
+        changed = False
+        if resp.status != 304:
             resp.raise_for_status()
-            return await resp.json()
 
-    coordinator_amber = DataUpdateCoordinator(
+            # Not every feed sends an ETag; skip decoding when the body is unchanged
+            raw = await resp.read()
+            digest = hashlib.sha256(raw).digest()
+            if digest != cache["digest"]:
+                cache["data"] = json_loads(raw)
+                cache["digest"] = digest
+                changed = True
+            cache["etag"] = resp.headers.get("ETag")
+            cache["last_modified"] = resp.headers.get("Last-Modified")
+
+        if changed:
+            cache["interval"] = min_interval.total_seconds()
+        else:
+            cache["interval"] = min(cache["interval"] * 2, max_interval.total_seconds())
+        cache["next_fetch"] = now + cache["interval"] - FEED_DUE_SLACK
+        return cache["data"]
+
+    # Single coordinator: AmberAlert (landactiehost), NL-Alert and Burgernet
+    # actions (v2) are fetched concurrently, each bounded by FETCH_TIMEOUT
+    async def _fetch_all():
+        results = await asyncio.gather(
+            *(_fetch_json(feed, url) for feed, url in FEEDS.items()),
+            return_exceptions=True,
+        )
+
+        data = {}
+        for feed, result in zip(FEEDS, results):
+            cache = feed_cache[feed]
+            if isinstance(result, BaseException):
+                # Log once per outage, like DataUpdateCoordinator does
+                if not cache["failed"]:
+                    _LOGGER.warning("Error fetching %s feed: %r", feed, result)
+                    cache["failed"] = True
+                result = None
+            elif cache["failed"] and result is not None:
+                _LOGGER.info("Fetching %s feed recovered", feed)
+                cache["failed"] = False
+            data[feed] = result
+
+        if all(payload is None for payload in data.values()):
+            raise UpdateFailed("Unable to fetch any NL-Alert/Burgernet feed")
+        return data
+
+    coordinator = DataUpdateCoordinator(
         hass,
         _LOGGER,
-        name=f"{DOMAIN}_amber",
-        update_interval=SCAN_INTERVAL,
-        update_method=_fetch_amber,
-    )
-
-    # NL-Alert JSON coordinator
-    async def _fetch_nl():
-        async with async_timeout.timeout(15):
-            resp = await session.get(
-                NL_ALERT_API,
-                headers={"Accept": "application/json"},
-            )
-            resp.raise_for_status()
-            return await resp.json()
-
-    coordinator_nl = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name=f"{DOMAIN}_nl_alert",
-        update_interval=SCAN_INTERVAL,
-        update_method=_fetch_nl,
-    )
-
-    # Burgernet actions (v2) with API key and radius filtering
-    async def _fetch_burgernet():
-        async with async_timeout.timeout(15):
-            resp = await session.get(
-                BURGERNET_ACTIONS_API,
-                headers={
-                    "Accept": "application/json",
-                },
-            )
-            resp.raise_for_status()
-            return await resp.json()
-
-    coordinator_burgernet = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name=f"{DOMAIN}_burgernet",
+        name=DOMAIN,
         update_interval=SCAN_INTERVAL,
-        update_method=_fetch_burgernet,
+        update_method=_fetch_all,
     )
 
     # initial fetch
-    await asyncio.gather(
-        coordinator_amber.async_config_entry_first_refresh(),
-        coordinator_nl.async_config_entry_first_refresh(),
-        coordinator_burgernet.async_config_entry_first_refresh(),
-    )
-
+    await coordinator.async_config_entry_first_refresh()
+
     burgernet_action_sensors = [
         BurgernetActionSensor(
-            coordinator_burgernet,
+            coordinator,
             hass,
             location_source,
             tracker_entity_id,
@@ -138,14 +206,14 @@ async def async_setup_entry(hass, entry, async_add_entities):
     async_add_entities(
         [
             AmberAlertSensor(
-                coordinator_amber,
+                coordinator,
                 hass,
                 location_source,
                 tracker_entity_id,
                 max_radius_m,
             ),
             BurgernetSearchSensor(
-                coordinator_burgernet,
+                coordinator,
                 hass,
                 location_source,
                 tracker_entity_id,
@@ -153,89 +221,27 @@ async def async_setup_entry(hass, entry, async_add_entities):
             ),
             *burgernet_action_sensors,
             NLAlertSensor(
-                coordinator_nl,
+                coordinator,
                 hass,
                 location_source,
                 tracker_entity_id,
                 max_radius_m,
             ),
-        ],
-        update_before_add=True,
+        ]
     )
 
 
-class AmberAlertSensor(CoordinatorEntity, SensorEntity):
-    """Amber/VKA sensor using Burgernet landactiehost API."""
-
-    def __init__(self, coordinator, hass, location_source, tracker_entity_id, max_radius_m):
-        super().__init__(coordinator)
-        self.hass = hass
-        self.location_source = location_source
-        self.tracker_entity_id = tracker_entity_id
-        # Radius currently unused for AmberAlert; retained for compatibility / potential future location filtering
-        self.max_radius_m = max_radius_m
-        self._attr_name = "AmberAlert"
-        self._attr_unique_id = "amber_alert"
-
-    @property
-    def available(self):
-        return self.coordinator.last_update_success
-
-    def _get_active_alerts(self):
-        """Return list of active alerts (State=Actual, Type=Alert/Update) with parsed levels."""
-        data = self.coordinator.data or []
-        if not isinstance(data, list):
-            return []
-
-        active = []
-        for alert in data:
-            state = alert.get("State")
-            alert_type = alert.get("Type")
-            if state != "Actual" or alert_type not in ("Alert", "Update"):
-                continue
-
-            try:
-                level = int(alert.get("AlertLevel", 0))
-            except (TypeError, ValueError):
-                level = 0
-
-            area = alert.get("Area") or {}
-            active.append(
-                {
-                    "alert_id": alert.get("AlertId"),
-                    "level": level,
-                    "state": state,
-                    "type": alert_type,
-                    "scope": alert.get("Scope"),
-                    "area_description": area.get("Description"),
-                    "circle": area.get("Circle"),
-                    "circle_km": area.get("CircleKM"),
-                }
-            )
-        return active
-
-    @property
-    def state(self):
-        """Return 'unsafe' if any active alert has level >= 5, otherwise 'safe'."""
-        active = self._get_active_alerts()
-        if any(a.get("level", 0) >= 5 for a in active):
-            return "unsafe"
-        return "safe"
-
-    @property
-    def extra_state_attributes(self):
-        active = self._get_active_alerts()
-        highest = max((a.get("level", 0) for a in active), default=0)
-        return {
-            "poster_url": STATIC_POSTER_URL,
-            "active_alerts_count": len(active),
-            "highest_alert_level": highest if highest > 0 else None,
-            "active_alerts": active,
-        }
-
-
-class BurgernetSearchSensor(CoordinatorEntity, SensorEntity):
-    """Burgernet sensor: location-filtered using actions API (v2)."""
+class _AlertSensorBase(CoordinatorEntity, SensorEntity):
+    """Base for sensors derived from one feed of the shared coordinator.
+
+    State and attributes are computed once per coordinator update in
+    _compute() and served from the cached values on every read. The
+    location is resolved once and refreshed only when the tracker entity
+    or the home location changes.
+    """
+
+    _feed = None
+    _uses_location = True
 
     def __init__(self, coordinator, hass, location_source, tracker_entity_id, max_radius_m):
         super().__init__(coordinator)
@@ -243,24 +249,140 @@ class BurgernetSearchSensor(CoordinatorEntity, SensorEntity):
         self.location_source = location_source
         self.tracker_entity_id = tracker_entity_id
         self.max_radius_m = max_radius_m
-        self._attr_name = "Burgernet"
-        self._attr_unique_id = "burgernet_search"
+        self._coords = None
+        self._computed_state = None
+        self._computed_attrs = {}
 
     @property
     def available(self):
-        return self.coordinator.last_update_success
+        return self.coordinator.last_update_success and self._payload is not None
 
-    def _get_actions(self):
-        lat0, lon0 = _resolve_coordinates(self.hass, self.location_source, self.tracker_entity_id)
-        return _prepare_burgernet_actions(self.coordinator.data, lat0, lon0, self.max_radius_m)
+    @property
+    def _payload(self):
+        return (self.coordinator.data or {}).get(self._feed)
+
+    def _compute(self):
+        """Return (state, attributes) for the current payload."""
+        raise NotImplementedError
+
+    def _update_computed(self):
+        self._computed_state, self._computed_attrs = self._compute()
+
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        if self._uses_location:
+            self._coords = _resolve_coordinates(self.hass, self.location_source, self.tracker_entity_id)
+            if self.location_source == "entity" and self.tracker_entity_id:
+                self.async_on_remove(
+                    async_track_state_change_event(
+                        self.hass, [self.tracker_entity_id], self._handle_location_change
+                    )
+                )
+            else:
+                self.async_on_remove(
+                    self.hass.bus.async_listen(EVENT_CORE_CONFIG_UPDATE, self._handle_location_change)
+                )
+        self._update_computed()
+
+    @callback
+    def _handle_location_change(self, event):
+        """Recompute when the tracked (or home) location actually moved."""
+        coords = _resolve_coordinates(self.hass, self.location_source, self.tracker_entity_id)
+        if coords == self._coords:
+            return
+        self._coords = coords
+        self._update_computed()
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self):
+        self._update_computed()
+        super()._handle_coordinator_update()
 
     @property
     def state(self):
-        actions = self._get_actions()
-        return "unsafe" if any(a.get("active") for a in actions) else "safe"
+        return self._computed_state
 
     @property
     def extra_state_attributes(self):
+        return self._computed_attrs
+
+
+class AmberAlertSensor(_AlertSensorBase):
+    """Amber/VKA sensor using Burgernet landactiehost API."""
+
+    _feed = FEED_AMBER
+    _uses_location = False
+
+    def __init__(self, coordinator, hass, location_source, tracker_entity_id, max_radius_m):
+        # Radius currently unused for AmberAlert; retained for compatibility / potential future location filtering
+        super().__init__(coordinator, hass, location_source, tracker_entity_id, max_radius_m)
+        self._attr_name = "AmberAlert"
+        self._attr_unique_id = "amber_alert"
+
+    def _get_active_alerts(self):
+        """Return list of active alerts (State=Actual, Type=Alert/Update) with parsed levels."""
+        data = self._payload or []
+        if not isinstance(data, list):
+            return []
+
+        active = []
+        for alert in data:
+            state = alert.get("State")
+            alert_type = alert.get("Type")
+            if state != "Actual" or alert_type not in ("Alert", "Update"):
+                continue
+
+            try:
+                level = int(alert.get("AlertLevel", 0))
+            except (TypeError, ValueError):
+                level = 0
+
+            area = alert.get("Area") or {}
+            active.append(
+                {
+                    "alert_id": alert.get("AlertId"),
+                    "level": level,
+                    "state": state,
+                    "type": alert_type,
+                    "scope": alert.get("Scope"),
+                    "area_description": area.get("Description"),
+                    "circle": area.get("Circle"),
+                    "circle_km": area.get("CircleKM"),
+                }
+            )
+        return active
+
+    def _compute(self):
+        """State is 'unsafe' if any active alert has level >= 5, otherwise 'safe'."""
+        active = self._get_active_alerts()
+        highest = max((a.get("level", 0) for a in active), default=0)
+        state = "unsafe" if highest >= 5 else "safe"
+        return state, {
+            "poster_url": STATIC_POSTER_URL,
+            "active_alerts_count": len(active),
+            "highest_alert_level": highest if highest > 0 else None,
+            "active_alerts": active,
+        }
+
+
+class BurgernetSearchSensor(_AlertSensorBase):
+    """Burgernet sensor: location-filtered using actions API (v2)."""
+
+    _feed = FEED_BURGERNET
+    # Full action list and conversation stay on the state but are not written to the recorder
+    _unrecorded_attributes = frozenset({"actions", "latest_conversation"})
+
+    def __init__(self, coordinator, hass, location_source, tracker_entity_id, max_radius_m):
+        super().__init__(coordinator, hass, location_source, tracker_entity_id, max_radius_m)
+        self._attr_name = "Burgernet"
+        self._attr_unique_id = "burgernet_search"
+
+    def _get_actions(self):
+        lat0, lon0 = self._coords
+        return _prepare_burgernet_actions_cached(self._payload, lat0, lon0, self.max_radius_m)
+
+    def _compute(self):
         actions = self._get_actions()
         active_actions = [a for a in actions if a.get("active")]
         latest = active_actions[0] if active_actions else (actions[0] if actions else None)
@@ -284,12 +406,16 @@ class BurgernetSearchSensor(CoordinatorEntity, SensorEntity):
             if area.get("distance_m") is not None:
                 attrs["nearest_action_distance_m"] = area["distance_m"]
 
-        return attrs
+        return ("unsafe" if active_actions else "safe"), attrs
 
 
-class BurgernetActionSensor(CoordinatorEntity, SensorEntity):
+class BurgernetActionSensor(_AlertSensorBase):
     """Individual Burgernet action sensor with GPS attributes."""
 
+    _feed = FEED_BURGERNET
+    # Message history stays on the state but is not written to the recorder
+    _unrecorded_attributes = frozenset({"conversation", "messages"})
+
     def __init__(
         self,
         coordinator,
@@ -300,44 +426,28 @@ class BurgernetActionSensor(CoordinatorEntity, SensorEntity):
         index,
         entry_id,
     ):
-        super().__init__(coordinator)
-        self.hass = hass
-        self.location_source = location_source
-        self.tracker_entity_id = tracker_entity_id
-        self.max_radius_m = max_radius_m
+        super().__init__(coordinator, hass, location_source, tracker_entity_id, max_radius_m)
         self.index = index
         self._attr_name = f"Burgernet Action {index + 1}"
         self._attr_unique_id = f"{entry_id}_burgernet_action_{index + 1}"
 
-    @property
-    def available(self):
-        return self.coordinator.last_update_success
-
     def _get_action(self):
-        lat0, lon0 = _resolve_coordinates(self.hass, self.location_source, self.tracker_entity_id)
-        actions = _prepare_burgernet_actions(self.coordinator.data, lat0, lon0, self.max_radius_m)
+        lat0, lon0 = self._coords
+        actions = _prepare_burgernet_actions_cached(self._payload, lat0, lon0, self.max_radius_m)
         if self.index < len(actions):
             return actions[self.index]
         return None
 
-    @property
-    def state(self):
-        action = self._get_action()
-        if not action:
-            return None
-        return "active" if action.get("active") else "closed"
-
-    @property
-    def extra_state_attributes(self):
+    def _compute(self):
         action = self._get_action()
         if not action:
-            return {
+            return None, {
                 "action_index": self.index + 1,
                 "active_action": False,
             }
 
         area = action.get("area") or {}
-        return {
+        return ("active" if action.get("active") else "closed"), {
             "action_index": self.index + 1,
             "action_id": action.get("id"),
             "municipality": action.get("municipality"),
@@ -357,114 +467,102 @@ class BurgernetActionSensor(CoordinatorEntity, SensorEntity):
         }
 
 
-class NLAlertSensor(CoordinatorEntity, SensorEntity):
+class NLAlertSensor(_AlertSensorBase):
     """NL-Alert sensor: unsafe if any polygon covers home within radius."""
-
-    def __init__(self, coordinator, hass, location_source, tracker_entity_id, max_radius_m):
-        super().__init__(coordinator)
-        self.hass = hass
-        self.location_source = location_source
-        self.tracker_entity_id = tracker_entity_id
-        self.max_radius_m = max_radius_m
-        self._attr_name = "NL-Alert"
-        self._attr_unique_id = "nl_alert"
-
-    @property
-    def available(self):
-        return self.coordinator.last_update_success
-
-    @property
-    def state(self):
-        items = (self.coordinator.data or {}).get("data", [])
-        return "unsafe" if self._get_active_item(items) else "safe"
-
-    @property
-    def extra_state_attributes(self):
-        item = self._get_active_item((self.coordinator.data or {}).get("data", []))
+
+    _feed = FEED_NL_ALERT
+
+    def __init__(self, coordinator, hass, location_source, tracker_entity_id, max_radius_m):
+        super().__init__(coordinator, hass, location_source, tracker_entity_id, max_radius_m)
+        self._attr_name = "NL-Alert"
+        self._attr_unique_id = "nl_alert"
+        # (coords, cos_lat0, dlat, dlon) for the last location queried
+        self._location_terms = None
+
+    def _compute(self):
+        item = self._get_active_item((self._payload or {}).get("data", []))
         message = item.get("message") if item else None
-        return {
+        return ("unsafe" if item else "safe"), {
             "nl_alert_id": item.get("id") if item else None,
             "nl_alert_message": message,
             "message": message,
         }
-
+
+    def _get_location_terms(self):
+        """Return (cos_lat0, dlat, dlon) for the current location, recomputed only when it moves."""
+        if self._location_terms is None or self._location_terms[0] != self._coords:
+            lat0 = self._coords[0]
+            cos_lat0 = math.cos(math.radians(lat0))
+            # Radius margin in degrees for the bounding box prefilter
+            dlat = math.degrees(self.max_radius_m / 6371000)
+            dlon = dlat / max(cos_lat0, 1e-6)
+            self._location_terms = (self._coords, cos_lat0, dlat, dlon)
+        return self._location_terms[1:]
+
     def _get_active_item(self, items):
-        lat0, lon0 = _resolve_coordinates(self.hass, self.location_source, self.tracker_entity_id)
+        lat0, lon0 = self._coords
+        cos_lat0, dlat, dlon = self._get_location_terms()
         now = dt_util.utcnow()
+
         for item in items:
             if not _is_active(item, now):
                 continue
-            for polygon in _iter_polygons(item.get("area")):
-                if not polygon:
-                    continue
-
-                if _point_in_polygon(lat0, lon0, polygon):
+            candidates = [
+                (polygon, center)
+                for polygon, (min_lat, max_lat, min_lon, max_lon), center in _item_polygons(item)
+                if min_lat - dlat <= lat0 <= max_lat + dlat
+                and min_lon - dlon <= lon0 <= max_lon + dlon
+            ]
+            # Nearest polygons first, so a hit usually ends the scan early
+            if len(candidates) > 1:
+                candidates.sort(
+                    key=lambda c: (c[1][0] - lat0) ** 2 + ((c[1][1] - lon0) * cos_lat0) ** 2
+                )
+
+            for polygon, _center in candidates:
+                if _polygon_hit(lat0, lon0, polygon, self.max_radius_m, cos_lat0):
                     return item
+        return None
 
-                if _min_distance_to_polygon_m(lat0, lon0, polygon) <= self.max_radius_m:
-                    return item
-        return None
-
-
-def _point_in_polygon(lat, lon, polygon):
-    """Even-odd rule for point-in-polygon; polygon is list of (lat, lon)."""
-    inside = False
-    n = len(polygon)
-    if n < 3:
-        return False
-
-    for i in range(n):
-        lat1, lon1 = polygon[i]
-        lat2, lon2 = polygon[(i + 1) % n]
-
-        if ((lon1 > lon) != (lon2 > lon)):
-            t = (lon - lon1) / (lon2 - lon1)
-            intersect_lat = lat1 + t * (lat2 - lat1)
-            if intersect_lat > lat:
-                inside = not inside
-    return inside
-
-
-def _min_distance_to_polygon_m(lat, lon, polygon):
-    """Return min distance in meters from point to polygon edges."""
-    if len(polygon) == 1:
-        p_lat, p_lon = polygon[0]
-        return haversine(lat, lon, p_lat, p_lon)
-
-    min_dist = float("inf")
-    for i in range(len(polygon)):
-        a_lat, a_lon = polygon[i]
-        b_lat, b_lon = polygon[(i + 1) % len(polygon)]
-        dist = _distance_point_to_segment_m(lat, lon, a_lat, a_lon, b_lat, b_lon)
-        if dist < min_dist:
-            min_dist = dist
-    return min_dist
-
-
-def _distance_point_to_segment_m(lat, lon, a_lat, a_lon, b_lat, b_lon):
-    """Approx distance from point to segment using local equirectangular projection."""
-    R = 6371000
-    lat0 = math.radians(lat)
-
-    ax = math.radians(a_lon - lon) * math.cos(lat0) * R
-    ay = math.radians(a_lat - lat) * R
-    bx = math.radians(b_lon - lon) * math.cos(lat0) * R
-    by = math.radians(b_lat - lat) * R
 
-    vx = bx - ax
-    vy = by - ay
+def _polygon_hit(lat, lon, polygon, max_radius_m, cos_lat0):
+    """Return True if the point is inside the polygon or within max_radius_m of an edge.
+
+    The (N, 2) (lat, lon) vertices are projected once to local equirectangular
+    metres around the point (cos_lat0 = cos(radians(lat))); the even-odd
+    ray cast and the edge distances both run on that projection, with the
+    point at the origin.
+    """
+    # Metres per degree of latitude; folded into one scalar per axis
+    m_per_deg = math.radians(6371000)
+    xs = (polygon[:, 1] - lon) * (cos_lat0 * m_per_deg)
+    ys = (polygon[:, 0] - lat) * m_per_deg
+    vx = np.roll(xs, -1) - xs
+    vy = np.roll(ys, -1) - ys
+
+    if len(polygon) >= 3:
+        crosses = (xs > 0) != (xs + vx > 0)
+        # Edges that do not cross the ray may divide by zero; they are masked out
+        with np.errstate(divide="ignore", invalid="ignore"):
+            intersect_ys = ys - xs * vy / vx
+        if np.count_nonzero(crosses & (intersect_ys > 0)) % 2:
+            return True
+
+    # Degenerate (zero-length) edges fall back to the distance to their start
     denom = vx * vx + vy * vy
-    if denom == 0:
-        return math.hypot(ax, ay)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.clip(-(xs * vx + ys * vy) / denom, 0, 1)
+    t = np.where(denom == 0, 0, t)
+    px = xs + t * vx
+    py = ys + t * vy
+    return bool((px * px + py * py).min() <= max_radius_m * max_radius_m)
+
 
-    t = max(0, min(1, - (ax * vx + ay * vy) / denom))
-    px = ax + t * vx
-    py = ay + t * vy
-    return math.hypot(px, py)
-
-
 def _iter_polygons(area):
-    """Yield polygons from the API 'area' field, tolerating strings or lists."""
+    """Return (polygon, bbox, center) tuples from the API 'area' field, tolerating strings or lists.
+
+    bbox is (min_lat, max_lat, min_lon, max_lon) and center is its (lat, lon) midpoint.
+    """
     if not area:
         return []
 
@@ -473,14 +571,44 @@ def _iter_polygons(area):
     entries = area if isinstance(area, (list, tuple)) else [area]
     for entry in entries:
         if isinstance(entry, str):
-            polygon = []
-            for pair in entry.strip().split():
-                try:
-                    plat, plon = map(float, pair.split(","))
-                    polygon.append((plat, plon))
-                except (TypeError, ValueError):
-                    continue
-            polygons.append(polygon)
+            polygon = _parse_polygon(entry)
+            if len(polygon):
+                lats, lons = polygon[:, 0], polygon[:, 1]
+                bbox = (float(lats.min()), float(lats.max()), float(lons.min()), float(lons.max()))
+                center = ((bbox[0] + bbox[1]) / 2, (bbox[2] + bbox[3]) / 2)
+                polygons.append((polygon, bbox, center))
+    return polygons
+
+
+def _parse_polygon(entry):
+    """Parse a "lat,lon lat,lon ..." string into an (N, 2) float32 array.
+
+    float32 keeps well under a metre of precision at NL latitudes.
+    """
+    # Fast path: NumPy parses all numbers in C; valid input has one comma per pair
+    try:
+        values = np.fromstring(entry.replace(",", " "), dtype=np.float32, sep=" ")
+    except ValueError:
+        values = None
+    if values is not None and values.size == 2 * entry.count(","):
+        return values.reshape(-1, 2)
+
+    # Malformed input: keep the well-formed pairs only
+    polygon = []
+    for pair in entry.strip().split():
+        try:
+            plat, plon = map(float, pair.split(","))
+            polygon.append((plat, plon))
+        except (TypeError, ValueError):
+            continue
+    return np.asarray(polygon, dtype=np.float32).reshape(-1, 2)
+
+
+def _item_polygons(item):
+    """Return the parsed polygons and bboxes of an NL-Alert item, parsed once per payload."""
+    polygons = item.get("_polygons")
+    if polygons is None:
+        polygons = item["_polygons"] = _iter_polygons(item.get("area"))
     return polygons
 
 
@@ -522,8 +650,21 @@ def _format_epoch(value):
     ts = _coerce_epoch_seconds(value)
     if ts is None:
         return None
-    dt = dt_util.utc_from_timestamp(ts)
-    return dt_util.as_local(dt).isoformat()
+    return datetime.fromtimestamp(ts, dt_util.DEFAULT_TIME_ZONE).isoformat()
+
+
+def _message_time(msg):
+    """Return (epoch seconds, local ISO string) of a message's last modification.
+
+    Stored on the message dict so it is parsed and formatted once per payload;
+    the ISO string is rebuilt if the Home Assistant time zone changes.
+    """
+    if "_ts" not in msg:
+        msg["_ts"] = _coerce_epoch_seconds(msg.get("lastModifiedTimestamp")) or 0
+    if msg.get("_tz") is not dt_util.DEFAULT_TIME_ZONE:
+        msg["_iso"] = _format_epoch(msg["_ts"] or None)
+        msg["_tz"] = dt_util.DEFAULT_TIME_ZONE
+    return msg["_ts"], msg["_iso"]
 
 
 def _prepare_burgernet_message(msg):
@@ -532,7 +673,7 @@ def _prepare_burgernet_message(msg):
         "body": msg.get("body"),
         "response_url": msg.get("responseUrl"),
         "message_type": msg.get("messageType"),
-        "last_modified": _format_epoch(msg.get("lastModifiedTimestamp")),
+        "last_modified": _message_time(msg)[1],
         "speech_id": msg.get("speechId"),
     }
 
@@ -547,20 +688,13 @@ def _extract_burgernet_actions(payload):
     return []
 
 
-def _prepare_burgernet_action(action, lat0, lon0, max_radius_m):
-    area = action.get("area") or {}
-    center_lat = area.get("lat")
-    center_lng = area.get("lng")
-    if center_lat is None or center_lng is None:
-        return None
-
-    distance_m = haversine(lat0, lon0, center_lat, center_lng)
-    if max_radius_m is not None and distance_m > max_radius_m:
-        return None
-
+def _prepare_burgernet_action(action, distance_m):
+    area = action["area"]
+    center_lat = area["lat"]
+    center_lng = area["lng"]
     radius_m = area.get("radius")
     messages = action.get("messages") or []
-    sorted_messages = sorted(messages, key=lambda m: m.get("lastModifiedTimestamp") or 0)
+    sorted_messages = sorted(messages, key=lambda m: _message_time(m)[0])
     latest = sorted_messages[-1] if sorted_messages else None
     action_id = action.get("id")
 
@@ -568,21 +702,23 @@ def _prepare_burgernet_action(action, lat0, lon0, max_radius_m):
     conversation_lines = [f"Status: {status}"]
     if action.get("municipality"):
         conversation_lines.append(f"Municipality: {action.get('municipality')}")
-    if center_lat is not None and center_lng is not None:
-        conversation_lines.append(f"Area: lat {center_lat}, lng {center_lng}, radius {radius_m} m")
+    conversation_lines.append(f"Area: lat {center_lat}, lng {center_lng}, radius {radius_m} m")
+
+    # Conversation lines and prepared messages in a single pass; only
+    # non-empty lines are appended
+    prepared_messages = []
     for msg in sorted_messages:
-        ts_label = _format_epoch(msg.get("lastModifiedTimestamp"))
+        ts_label = _message_time(msg)[1]
         prefix_bits = [b for b in [ts_label, msg.get("messageType")] if b]
         prefix = " | ".join(prefix_bits)
         body = msg.get("body") or msg.get("title") or ""
         line = f"{prefix}: {body}" if prefix else body
         if line:
             conversation_lines.append(line)
+        prepared_messages.append(_prepare_burgernet_message(msg))
     if not action.get("active"):
         conversation_lines.append("Case closed.")
-    conversation = "\n".join([line for line in conversation_lines if line])
-
-    prepared_messages = [_prepare_burgernet_message(msg) for msg in sorted_messages]
+    conversation = "\n".join(conversation_lines)
 
     start_ts = _coerce_epoch_seconds(action.get("startTimestamp"))
     end_ts = _coerce_epoch_seconds(action.get("endTimestamp"))
@@ -593,7 +729,7 @@ def _prepare_burgernet_action(action, lat0, lon0, max_radius_m):
     if latest:
         latest_message_text = latest.get("body") or latest.get("title")
         latest_message_type = latest.get("messageType")
-        latest_message_time = _format_epoch(latest.get("lastModifiedTimestamp"))
+        latest_message_time = _message_time(latest)[1]
         if status == "closed" and latest_message_text:
             latest_message_text = f"{latest_message_text} (case closed)"
 
@@ -622,10 +758,46 @@ def _prepare_burgernet_action(action, lat0, lon0, max_radius_m):
 
 
 def _prepare_burgernet_actions(payload, lat0, lon0, max_radius_m):
-    actions = []
+    candidates = []
     for action in _extract_burgernet_actions(payload):
-        prepared = _prepare_burgernet_action(action, lat0, lon0, max_radius_m)
-        if prepared:
-            actions.append(prepared)
+        area = action.get("area") or {}
+        if area.get("lat") is not None and area.get("lng") is not None:
+            candidates.append(action)
+    if not candidates:
+        return []
+
+    # Distances to all action centers in one vectorized pass
+    centers = np.array(
+        [(action["area"]["lat"], action["area"]["lng"]) for action in candidates],
+        dtype=np.float64,
+    )
+    distances = _haversine_np(lat0, lon0, centers[:, 0], centers[:, 1])
+
+    actions = []
+    for action, distance_m in zip(candidates, distances.tolist()):
+        if max_radius_m is not None and distance_m > max_radius_m:
+            continue
+        actions.append(_prepare_burgernet_action(action, distance_m))
     actions.sort(key=lambda a: a.get("start_ts") or 0, reverse=True)
     return actions
+
+
+# Prepared actions shared by the search and action sensors, keyed on the
+# payload object, query and time zone; holding the payload keeps its id() from
+# being reused
+_BURGERNET_ACTIONS_CACHE = {}
+_BURGERNET_ACTIONS_CACHE_SIZE = 8
+
+
+def _prepare_burgernet_actions_cached(payload, lat0, lon0, max_radius_m):
+    """Return _prepare_burgernet_actions, computed once per payload and location."""
+    key = (id(payload), lat0, lon0, max_radius_m, dt_util.DEFAULT_TIME_ZONE)
+    cached = _BURGERNET_ACTIONS_CACHE.get(key)
+    if cached is not None and cached[0] is payload:
+        return cached[1]
+
+    actions = _prepare_burgernet_actions(payload, lat0, lon0, max_radius_m)
+    if len(_BURGERNET_ACTIONS_CACHE) >= _BURGERNET_ACTIONS_CACHE_SIZE:
+        _BURGERNET_ACTIONS_CACHE.clear()
+    _BURGERNET_ACTIONS_CACHE[key] = (payload, actions)
+    return actions